@@ -0,0 +1,286 @@
+"""Precomputed built-in sample corpus.
+
+Generated by scripts/_gen_builtin_corpus.py — do not edit by hand.
+"""
+
+BUILTIN_DOCS = [{'title': 'Artificial Intelligence Overview',
+  'content': 'Artificial intelligence (AI) is intelligence demonstrated by machines, as opposed to '
+             'natural intelligence displayed by animals including humans. AI research has been '
+             'defined as the field of study of intelligent agents, which refers to any system that '
+             'perceives its environment and takes actions that maximize its chance of achieving '
+             'its goals. The term artificial intelligence had previously been used to describe '
+             'machines that mimic and display human cognitive skills that are associated with the '
+             'human mind, such as learning and problem-solving. This definition has since been '
+             'rejected by major AI researchers who now describe AI in terms of rationality and '
+             'acting rationally, which does not limit how intelligence can be articulated.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Machine Learning Fundamentals',
+  'content': 'Machine learning is a method of data analysis that automates analytical model '
+             'building. It is a branch of artificial intelligence based on the idea that systems '
+             'can learn from data, identify patterns and make decisions with minimal human '
+             'intervention. Machine learning algorithms are trained on data sets that contain many '
+             'examples that include the desired inputs and outputs. The algorithm then tries to '
+             'identify patterns in the data that map the inputs to the outputs.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Data Science Introduction',
+  'content': 'Data science is an interdisciplinary field that uses scientific methods, processes, '
+             'algorithms and systems to extract knowledge and insights from structured and '
+             'unstructured data. Data science is related to data mining, machine learning and big '
+             'data. Data science is a concept to unify statistics, data analysis, informatics, and '
+             'their related methods in order to understand and analyze actual phenomena with data.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Natural Language Processing',
+  'content': 'Natural language processing (NLP) is a subfield of linguistics, computer science, '
+             'and artificial intelligence concerned with the interactions between computers and '
+             'human language, in particular how to program computers to process and analyze large '
+             'amounts of natural language data. The goal is a computer capable of understanding '
+             'the contents of documents, including the contextual nuances of the language within '
+             'them.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Deep Learning Networks',
+  'content': 'Deep learning is part of a broader family of machine learning methods based on '
+             'artificial neural networks with representation learning. Learning can be supervised, '
+             'semi-supervised or unsupervised. Deep-learning architectures such as deep neural '
+             'networks, deep belief networks, deep reinforcement learning, recurrent neural '
+             'networks and convolutional neural networks have been applied to fields including '
+             'computer vision, speech recognition, natural language processing, machine '
+             'translation, bioinformatics, drug design, medical image analysis, material '
+             'inspection and board game programs.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Computer Vision',
+  'content': 'Computer Vision is an important area of study in computer science and technology. It '
+             'encompasses various methodologies, techniques, and best practices that are essential '
+             'for modern software development and technological advancement. Understanding '
+             'Computer Vision requires both theoretical knowledge and practical experience. '
+             'Researchers and practitioners continue to develop new approaches and improvements in '
+             'this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Reinforcement Learning',
+  'content': 'Reinforcement Learning is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Reinforcement Learning requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Neural Architecture Search',
+  'content': 'Neural Architecture Search is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Neural Architecture Search requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Transfer Learning',
+  'content': 'Transfer Learning is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Transfer Learning requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Generative Adversarial Networks',
+  'content': 'Generative Adversarial Networks is an important area of study in computer science '
+             'and technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Generative Adversarial Networks requires both theoretical knowledge '
+             'and practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Transformer Models',
+  'content': 'Transformer Models is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Transformer Models requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'BERT and Language Models',
+  'content': 'BERT and Language Models is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding BERT and Language Models requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Computer Graphics',
+  'content': 'Computer Graphics is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Computer Graphics requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Quantum Computing',
+  'content': 'Quantum Computing is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Quantum Computing requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Blockchain Technology',
+  'content': 'Blockchain Technology is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Blockchain Technology requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Cloud Computing',
+  'content': 'Cloud Computing is an important area of study in computer science and technology. It '
+             'encompasses various methodologies, techniques, and best practices that are essential '
+             'for modern software development and technological advancement. Understanding Cloud '
+             'Computing requires both theoretical knowledge and practical experience. Researchers '
+             'and practitioners continue to develop new approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Edge Computing',
+  'content': 'Edge Computing is an important area of study in computer science and technology. It '
+             'encompasses various methodologies, techniques, and best practices that are essential '
+             'for modern software development and technological advancement. Understanding Edge '
+             'Computing requires both theoretical knowledge and practical experience. Researchers '
+             'and practitioners continue to develop new approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Internet of Things',
+  'content': 'Internet of Things is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Internet of Things requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Cybersecurity',
+  'content': 'Cybersecurity is an important area of study in computer science and technology. It '
+             'encompasses various methodologies, techniques, and best practices that are essential '
+             'for modern software development and technological advancement. Understanding '
+             'Cybersecurity requires both theoretical knowledge and practical experience. '
+             'Researchers and practitioners continue to develop new approaches and improvements in '
+             'this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Software Engineering',
+  'content': 'Software Engineering is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Software Engineering requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Database Systems',
+  'content': 'Database Systems is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Database Systems requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Distributed Systems',
+  'content': 'Distributed Systems is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Distributed Systems requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Operating Systems',
+  'content': 'Operating Systems is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Operating Systems requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Computer Networks',
+  'content': 'Computer Networks is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Computer Networks requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Web Development',
+  'content': 'Web Development is an important area of study in computer science and technology. It '
+             'encompasses various methodologies, techniques, and best practices that are essential '
+             'for modern software development and technological advancement. Understanding Web '
+             'Development requires both theoretical knowledge and practical experience. '
+             'Researchers and practitioners continue to develop new approaches and improvements in '
+             'this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Mobile Development',
+  'content': 'Mobile Development is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Mobile Development requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'DevOps Practices',
+  'content': 'DevOps Practices is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding DevOps Practices requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Agile Methodology',
+  'content': 'Agile Methodology is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Agile Methodology requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Software Testing',
+  'content': 'Software Testing is an important area of study in computer science and technology. '
+             'It encompasses various methodologies, techniques, and best practices that are '
+             'essential for modern software development and technological advancement. '
+             'Understanding Software Testing requires both theoretical knowledge and practical '
+             'experience. Researchers and practitioners continue to develop new approaches and '
+             'improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Version Control Systems',
+  'content': 'Version Control Systems is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Version Control Systems requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''},
+ {'title': 'Continuous Integration',
+  'content': 'Continuous Integration is an important area of study in computer science and '
+             'technology. It encompasses various methodologies, techniques, and best practices '
+             'that are essential for modern software development and technological advancement. '
+             'Understanding Continuous Integration requires both theoretical knowledge and '
+             'practical experience. Researchers and practitioners continue to develop new '
+             'approaches and improvements in this field.',
+  'source': 'Built-in Sample',
+  'url': ''}]
@@ -4,21 +4,88 @@ Handles document indexing and detection history (offline mode).
 """
 
 import sqlite3
-import json
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+# orjson is ~10x faster than stdlib json for the small result dicts we
+# serialize on every detection; fall back gracefully if unavailable.
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj)
+
+    def _loads(data):
+        return json.loads(data)
+
+# Module-level SQL constants: sqlite3 caches prepared statements per
+# connection keyed by the SQL text, so passing the same string object on
+# every call skips re-parsing entirely.
+SQL_INSERT_DOC = '''
+    INSERT OR REPLACE INTO documents (id, title, content, source, url)
+    VALUES (?, ?, ?, ?, ?)
+'''
+SQL_SELECT_DOCS = 'SELECT id, title, content, source, url FROM documents'
+SQL_COUNT_DOCS = 'SELECT COUNT(*) FROM documents'
+SQL_INSERT_HIST = '''
+    INSERT INTO detection_history (input_text, detection_type, result)
+    VALUES (?, ?, ?)
+'''
+SQL_SELECT_HIST = '''
+    SELECT id, input_text, detection_type, result, created_at
+    FROM detection_history
+    ORDER BY created_at DESC
+    LIMIT ?
+'''
+SQL_CLEAR_HIST = 'DELETE FROM detection_history'
+SQL_GET_SETTING = 'SELECT value FROM settings WHERE key = ?'
+SQL_SET_SETTING = '''
+    INSERT OR REPLACE INTO settings (key, value, updated_at)
+    VALUES (?, ?, ?)
+'''
+
 
 class LocalDatabase:
     def __init__(self, db_path: str = "data/jasper.db"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Single long-lived connection: avoids per-call open/close and
+        # keeps the SQLite page cache warm. Writes are serialized with a
+        # lock so the connection can be shared across threads.
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=128
+        )
+        self._write_lock = threading.Lock()
+        self._configure_connection()
         self.init_db()
-    
+
+    def _configure_connection(self):
+        """Apply per-connection pragmas for better throughput."""
+        cursor = self._conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-64000')  # ~64MB page cache
+        cursor.close()
+
+    def close(self):
+        """Close the underlying connection."""
+        self._conn.close()
+
     def init_db(self):
         """Initialize database schema."""
-        conn = sqlite3.connect(str(self.db_path))
+        conn = self._conn
         cursor = conn.cursor()
         
         # Documents table for corpus
@@ -52,32 +119,41 @@ class LocalDatabase:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
-        
+
+        # Index for the ORDER BY created_at DESC LIMIT queries on history;
+        # without it SQLite full-scans and sorts as the table grows.
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_hist_created
+            ON detection_history(created_at DESC)
+        ''')
+
         conn.commit()
-        conn.close()
-    
+
     def add_document(self, doc_id: str, title: str, content: str, source: str = "", url: str = ""):
         """Add a document to the corpus."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO documents (id, title, content, source, url)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (doc_id, title, content, source, url))
-        
-        conn.commit()
-        conn.close()
-    
+        with self._write_lock:
+            self._conn.execute(SQL_INSERT_DOC, (doc_id, title, content, source, url))
+            self._conn.commit()
+
+    def add_documents_bulk(self, rows: List[tuple]):
+        """Add many documents in one transaction.
+
+        Each row is a (doc_id, title, content, source, url) tuple. Using
+        executemany inside a single transaction amortizes the commit
+        fsync over the whole batch instead of paying it per document.
+        """
+        if not rows:
+            return
+        with self._write_lock:
+            self._conn.executemany(SQL_INSERT_DOC, rows)
+            self._conn.commit()
+
     def get_all_documents(self) -> List[Dict]:
         """Retrieve all documents."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT id, title, content, source, url FROM documents')
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_SELECT_DOCS)
         rows = cursor.fetchall()
-        conn.close()
-        
+
         return [
             {
                 'id': row[0],
@@ -91,49 +167,32 @@ class LocalDatabase:
     
     def get_document_count(self) -> int:
         """Get total number of documents."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT COUNT(*) FROM documents')
-        count = cursor.fetchone()[0]
-        conn.close()
-        
-        return count
-    
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_COUNT_DOCS)
+        return cursor.fetchone()[0]
+
     def save_detection_result(self, input_text: str, detection_type: str, result: Dict):
         """Save detection result to history."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO detection_history (input_text, detection_type, result)
-            VALUES (?, ?, ?)
-        ''', (input_text[:1000], detection_type, json.dumps(result)))  # Limit input text size
-        
-        conn.commit()
-        conn.close()
-    
+        with self._write_lock:
+            self._conn.execute(
+                SQL_INSERT_HIST,
+                (input_text[:1000], detection_type, _dumps(result)),  # Limit input text size
+            )
+            self._conn.commit()
+
     def get_detection_history(self, limit: int = 50) -> List[Dict]:
         """Retrieve recent detection history."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, input_text, detection_type, result, created_at
-            FROM detection_history
-            ORDER BY created_at DESC
-            LIMIT ?
-        ''', (limit,))
-        
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_SELECT_HIST, (limit,))
+
         rows = cursor.fetchall()
-        conn.close()
-        
+
         return [
             {
                 'id': row[0],
                 'input_text': row[1],
                 'detection_type': row[2],
-                'result': json.loads(row[3]),
+                'result': _loads(row[3]),
                 'created_at': row[4]
             }
             for row in rows
@@ -141,33 +200,19 @@ class LocalDatabase:
     
     def clear_history(self):
         """Clear all detection history."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM detection_history')
-        conn.commit()
-        conn.close()
-    
+        with self._write_lock:
+            self._conn.execute(SQL_CLEAR_HIST)
+            self._conn.commit()
+
     def get_setting(self, key: str) -> Optional[str]:
         """Get a setting value."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
+        cursor = self._conn.cursor()
+        cursor.execute(SQL_GET_SETTING, (key,))
         row = cursor.fetchone()
-        conn.close()
-        
         return row[0] if row else None
-    
+
     def set_setting(self, key: str, value: str):
         """Set a setting value."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO settings (key, value, updated_at)
-            VALUES (?, ?, ?)
-        ''', (key, value, datetime.now().isoformat()))
-        
-        conn.commit()
-        conn.close()
+        with self._write_lock:
+            self._conn.execute(SQL_SET_SETTING, (key, value, datetime.now().isoformat()))
+            self._conn.commit()
@@ -3,6 +3,7 @@ Corpus Manager for FAISS indexing and document management.
 """
 
 import os
+import heapq
 import json
 import numpy as np
 from pathlib import Path
@@ -12,6 +13,29 @@ import faiss
 import nltk
 from nltk.tokenize import sent_tokenize
 
+# orjson's C encoder is ~3-5x faster than stdlib json on the metadata
+# list once it grows to thousands of entries; stdlib stays the fallback
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _dump_metadata(metadata, path: Path):
+    if HAS_ORJSON:
+        path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+
+
+def _load_metadata(path: Path):
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 # Configure NLTK to use local data directory
 LOCAL_NLTK_DATA = os.path.join(os.path.dirname(__file__), '..', 'models_local', 'nltk_data')
 if os.path.exists(LOCAL_NLTK_DATA):
@@ -36,14 +60,24 @@ class CorpusManager:
         else:
             self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         
-        # Load or create index
+        # Load or create index. HNSW over normalized inner product gives
+        # sub-linear cosine search instead of brute-force L2 scans.
         if self.index_path.exists():
             self.index = faiss.read_index(str(self.index_path))
-            with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                self.metadata = json.load(f)
+            self.metadata = _load_metadata(self.metadata_path)
         else:
-            self.index = faiss.IndexFlatL2(384)  # all-MiniLM-L6-v2 dimension
+            self.index = faiss.IndexHNSWFlat(384, 32, faiss.METRIC_INNER_PRODUCT)  # all-MiniLM-L6-v2 dimension
+            # Wider construction beam buys recall once the corpus grows
+            # past a few thousand sentences; build cost is one-time.
+            self.index.hnsw.efConstruction = 200
             self.metadata = []
+
+        # Populated by load_shards() when a sharded corpus is in use
+        self.shards = []
+
+        # Open spool file while streaming embeddings to disk (see
+        # begin_streaming)
+        self._stream_file = None
     
     def add_document(self, doc_id: str, title: str, text: str, source: str = "", url: str = ""):
         """Add a document to the corpus and index it."""
@@ -58,9 +92,11 @@ class CorpusManager:
             return
         
         embeddings = self.embedding_model.encode(sentences)
-        
-        # Add to FAISS index
-        self.index.add(embeddings.astype('float32'))
+
+        # Normalize so inner product equals cosine similarity, then index
+        embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+        faiss.normalize_L2(embeddings)
+        self.index.add(embeddings)
         
         # Add metadata
         self.metadata.append({
@@ -73,11 +109,163 @@ class CorpusManager:
         
         print(f"Added document '{title}' with {len(sentences)} sentences")
     
+    def add_documents_bulk(self, docs: List[Dict]):
+        """Add many documents with a single encode and index call.
+
+        Each doc is a dict with keys: id, title, content, and optionally
+        source and url. Encoding all sentences in one batched call keeps
+        the model's MatMuls saturated instead of paying per-document
+        warm-up, and FAISS ingests the whole block at once.
+        """
+        all_sentences = []
+        doc_sentence_counts = []
+        for doc in docs:
+            # Save text file
+            text_file = self.texts_dir / f"{doc['id']}.txt"
+            with open(text_file, 'w', encoding='utf-8') as f:
+                f.write(doc['content'])
+
+            sentences = sent_tokenize(doc['content'])
+            all_sentences.extend(sentences)
+            doc_sentence_counts.append(len(sentences))
+
+        if not all_sentences:
+            return
+
+        embeddings = self.embedding_model.encode(
+            all_sentences,
+            batch_size=128,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+        faiss.normalize_L2(embeddings)
+        if self._stream_file is not None:
+            self._stream_batch(embeddings)
+        else:
+            self.index.add(embeddings)
+
+        for doc, num_sentences in zip(docs, doc_sentence_counts):
+            self.metadata.append({
+                'id': doc['id'],
+                'title': doc['title'],
+                'source': doc.get('source', ''),
+                'url': doc.get('url', ''),
+                'num_sentences': num_sentences
+            })
+
+        print(f"Added {len(docs)} documents with {len(all_sentences)} sentences")
+
+    def add_preencoded(self, docs: List[Dict], embeddings: np.ndarray, sentence_counts):
+        """Add documents whose sentence embeddings were computed ahead of time.
+
+        Skips tokenization and the encoder entirely: one bulk index.add
+        plus metadata appends, with no per-document Python dispatch in
+        between. Embeddings must be L2-normalized float32 rows in
+        sentence order matching docs/sentence_counts.
+        """
+        for doc, num_sentences in zip(docs, sentence_counts):
+            text_file = self.texts_dir / f"{doc['id']}.txt"
+            with open(text_file, 'w', encoding='utf-8') as f:
+                f.write(doc['content'])
+            self.metadata.append({
+                'id': doc['id'],
+                'title': doc['title'],
+                'source': doc.get('source', ''),
+                'url': doc.get('url', ''),
+                'num_sentences': int(num_sentences)
+            })
+
+        self.index.add(np.ascontiguousarray(embeddings, dtype='float32'))
+        print(f"Added {len(docs)} documents from {len(embeddings)} precomputed embeddings")
+
+    def begin_streaming(self, dim: int = 384):
+        """Spool embedding batches to an append-only float32 file.
+
+        While streaming is active, add_documents_bulk writes each
+        encoded batch sequentially to disk instead of growing the
+        in-memory index, capping peak RAM at one batch regardless of
+        corpus size. Call end_streaming to fold the spool into the
+        index.
+        """
+        self._stream_path = self.corpus_dir / "embs.f32"
+        self._stream_file = open(self._stream_path, 'wb')
+        self._stream_dim = dim
+        self._stream_count = 0
+
+    def _stream_batch(self, embeddings: np.ndarray):
+        self._stream_file.write(
+            np.ascontiguousarray(embeddings, dtype=np.float32).tobytes())
+        self._stream_count += len(embeddings)
+
+    def end_streaming(self) -> int:
+        """Map the spooled embeddings back and add them to the index.
+
+        The memmap is ingested in fixed-size slices so peak RSS stays
+        bounded; the spool file is removed afterwards.
+        """
+        self._stream_file.close()
+        self._stream_file = None
+
+        if self._stream_count:
+            mm = np.memmap(
+                self._stream_path,
+                dtype=np.float32,
+                mode='r',
+                shape=(self._stream_count, self._stream_dim),
+            )
+            for start in range(0, self._stream_count, 4096):
+                self.index.add(np.ascontiguousarray(mm[start:start + 4096]))
+            del mm
+
+        self._stream_path.unlink(missing_ok=True)
+        return self._stream_count
+
+    def save_shard(self, shard_id: int):
+        """Persist the in-memory index/metadata as one shard.
+
+        Shards written by parallel builder processes (see
+        scripts/build_corpus_sharded.py) are equivalent in aggregate to
+        one monolithic index; load_shards/search_shards merge them at
+        query time.
+        """
+        shard_index_path = self.corpus_dir / f"shard_{shard_id}.faiss"
+        shard_meta_path = self.corpus_dir / f"shard_{shard_id}_metadata.json"
+        faiss.write_index(self.index, str(shard_index_path))
+        _dump_metadata(self.metadata, shard_meta_path)
+        print(f"Saved shard {shard_id}: {self.index.ntotal} vectors, {len(self.metadata)} documents")
+
+    def load_shards(self) -> int:
+        """Load every shard_*.faiss from the corpus directory."""
+        self.shards = []
+        for shard_index_path in sorted(self.corpus_dir.glob("shard_*.faiss")):
+            shard_meta_path = shard_index_path.with_name(shard_index_path.stem + "_metadata.json")
+            index = faiss.read_index(str(shard_index_path))
+            metadata = _load_metadata(shard_meta_path)
+            self.shards.append((index, metadata))
+        return len(self.shards)
+
+    def search_shards(self, query_embeddings: np.ndarray, k: int = 5):
+        """Search all loaded shards and heap-merge the per-shard top-k.
+
+        Returns, per query row, a list of (similarity, shard_id,
+        local_index) triples — identical results to searching one
+        monolithic index holding every shard's vectors.
+        """
+        query_embeddings = np.ascontiguousarray(query_embeddings, dtype='float32')
+        per_query = [[] for _ in range(len(query_embeddings))]
+        for shard_id, (index, _metadata) in enumerate(self.shards):
+            similarities, indices = index.search(query_embeddings, k)
+            for q in range(len(query_embeddings)):
+                for sim, idx in zip(similarities[q], indices[q]):
+                    if idx >= 0:
+                        per_query[q].append((float(sim), shard_id, int(idx)))
+        return [heapq.nlargest(k, hits) for hits in per_query]
+
     def save(self):
         """Save FAISS index and metadata to disk."""
         faiss.write_index(self.index, str(self.index_path))
-        with open(self.metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(self.metadata, f, indent=2)
+        _dump_metadata(self.metadata, self.metadata_path)
         print(f"Saved corpus: {self.index.ntotal} vectors, {len(self.metadata)} documents")
     
     def get_stats(self) -> Dict:
@@ -1,21 +1,26 @@
 """Pydantic models for detection API."""
 
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class DetectionRequest(BaseModel):
+class StrictModel(BaseModel):
+    """Base model: rejects unknown fields at the Rust validator level."""
+    model_config = ConfigDict(extra='forbid')
+
+
+class DetectionRequest(StrictModel):
     text: str = Field(..., min_length=1, description="Text to analyze")
 
 
-class MatchedSentence(BaseModel):
+class MatchedSentence(StrictModel):
     input_sentence: str
     matched_source: str
     similarity: float
     source_url: Optional[str] = None
 
 
-class PlagiarismResult(BaseModel):
+class PlagiarismResult(StrictModel):
     plagiarism_score: float
     plagiarism_level: str
     matched_sentences: List[MatchedSentence]
@@ -24,13 +29,13 @@ class PlagiarismResult(BaseModel):
     note: Optional[str] = None
 
 
-class AIDetectionDetails(BaseModel):
+class AIDetectionDetails(StrictModel):
     perplexity_score: float
     burstiness_score: float
     classifier_score: float
 
 
-class AIDetectionResult(BaseModel):
+class AIDetectionResult(StrictModel):
     ai_probability: float
     ai_confidence: str
     perplexity: Optional[float] = None
@@ -39,12 +44,12 @@ class AIDetectionResult(BaseModel):
     details: Optional[AIDetectionDetails] = None
 
 
-class HybridDetectionResult(BaseModel):
+class HybridDetectionResult(StrictModel):
     plagiarism: PlagiarismResult
     ai_detection: AIDetectionResult
 
 
-class CorpusStats(BaseModel):
+class CorpusStats(StrictModel):
     total_documents: int
     total_vectors: int
     index_size_mb: float
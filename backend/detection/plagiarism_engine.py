@@ -6,6 +6,9 @@ Real similarity detection using TF-IDF, sentence embeddings, and FAISS.
 import os
 import re
 import json
+import string
+import hashlib
+from collections import OrderedDict
 import numpy as np
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
@@ -15,6 +18,13 @@ from sklearn.metrics.pairwise import cosine_similarity
 from sentence_transformers import SentenceTransformer
 import faiss
 import nltk
+
+# Optional MinHash-LSH prefilter; detection works without it
+try:
+    from datasketch import MinHash, MinHashLSH
+    HAS_DATASKETCH = True
+except ImportError:
+    HAS_DATASKETCH = False
 from nltk.corpus import stopwords
 from nltk.tokenize import sent_tokenize, word_tokenize
 
@@ -33,6 +43,21 @@ try:
 except LookupError:
     nltk.download('stopwords', quiet=True)
 
+# Precompiled preprocessing patterns (compiling per call re-scans the
+# pattern cache and re-walks the string once per substitution)
+_URL_RE = re.compile(r'http\S+|www\S+')
+
+# Translate table for the character filter: str.translate runs as a
+# single C loop, much cheaper than a regex pass on long documents. Any
+# codepoint not explicitly kept is deleted via __missing__.
+class _DropUnknownTable(dict):
+    def __missing__(self, code):
+        return None
+
+
+_KEEP = string.ascii_lowercase + string.digits + string.whitespace + '.,!?'
+_STRIP_TABLE = _DropUnknownTable({ord(c): c for c in _KEEP})
+
 
 class PlagiarismDetector:
     def __init__(self, corpus_dir: str = "data/corpus"):
@@ -44,7 +69,19 @@ class PlagiarismDetector:
         self.embedding_model = None
         self.index = None
         self.metadata = []
-        self.corpus_docs = []
+        self.corpus_files = []
+        # Metadata index of each entry in corpus_files; keeps LSH keys
+        # in the same index space as vec_to_doc when text files are
+        # missing on disk
+        self.corpus_meta_idx = []
+        self.vec_to_doc = np.empty(0, dtype=np.int32)
+        self.tfidf_vectorizer = None
+        self.corpus_tfidf = None
+
+        # Memoize detect() by content hash: repeat inputs skip the
+        # TF-IDF transform and embedding search entirely
+        self._result_cache = OrderedDict()
+        self._cache_size = 1024
         self.stop_words = set(stopwords.words('english'))
         
         self._load_resources()
@@ -61,31 +98,112 @@ class PlagiarismDetector:
             print("WARNING: Local model not found. Downloading (requires internet)...")
             self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
         
-        # Load FAISS index if exists
+        # Load FAISS index if exists. The detector only searches, so
+        # memory-map the file read-only when the index type supports it:
+        # the kernel pages in touched cells instead of loading everything
+        # up front, cutting cold-start time and RSS.
         if self.index_path.exists():
-            self.index = faiss.read_index(str(self.index_path))
+            try:
+                self.index = faiss.read_index(
+                    str(self.index_path),
+                    faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                )
+            except Exception:
+                self.index = faiss.read_index(str(self.index_path))
+
+            # Indexes built before the HNSW/cosine migration used L2
+            # distances; thresholding those as similarities would flag
+            # the *least* similar sentences. Refuse the stale index
+            # rather than silently inverting the semantics.
+            if self.index.metric_type != faiss.METRIC_INNER_PRODUCT:
+                print("WARNING: Corpus index uses an incompatible metric "
+                      "(built by an older version). Ignoring it — re-run "
+                      "scripts/build_corpus.py to rebuild the corpus.")
+                self.index = faiss.IndexHNSWFlat(384, 32, faiss.METRIC_INNER_PRODUCT)
+
             with open(self.metadata_path, 'r', encoding='utf-8') as f:
                 self.metadata = json.load(f)
             
-            # Load corpus documents
-            for meta in self.metadata:
+            # Record corpus file paths; contents are streamed on demand
+            # rather than held resident for the process lifetime
+            for meta_idx, meta in enumerate(self.metadata):
                 text_file = self.texts_dir / f"{meta['id']}.txt"
                 if text_file.exists():
-                    with open(text_file, 'r', encoding='utf-8') as f:
-                        self.corpus_docs.append(f.read())
+                    self.corpus_files.append(text_file)
+                    self.corpus_meta_idx.append(meta_idx)
+
+            # Vectors are added per document in metadata order, so the
+            # exact vector -> document mapping can be rebuilt from the
+            # per-document sentence counts.
+            counts = [meta.get('num_sentences', 0) for meta in self.metadata]
+            self.vec_to_doc = np.repeat(
+                np.arange(len(self.metadata), dtype=np.int32), counts
+            )
         else:
-            # Initialize empty index
-            self.index = faiss.IndexFlatL2(384)  # all-MiniLM-L6-v2 dimension
-    
+            # Initialize empty index (HNSW over cosine, matching CorpusManager)
+            self.index = faiss.IndexHNSWFlat(384, 32, faiss.METRIC_INNER_PRODUCT)  # all-MiniLM-L6-v2 dimension
+
+        self._fit_tfidf()
+        self._build_lsh()
+
+    def _iter_corpus_texts(self):
+        """Yield corpus document texts one at a time.
+
+        Keeps peak memory at one document instead of the whole corpus;
+        consumers (TF-IDF fit, LSH build) only need a single pass.
+        """
+        for text_file in self.corpus_files:
+            with open(text_file, 'r', encoding='utf-8') as f:
+                yield f.read()
+
+    def _build_lsh(self):
+        """Build a MinHash-LSH prefilter over document shingles.
+
+        Clearly dissimilar inputs are rejected with an O(1) LSH lookup
+        before any sentence embedding or FAISS search happens.
+        """
+        self.lsh = None
+        self.doc_minhashes = {}
+        if not HAS_DATASKETCH or not self.corpus_files:
+            return
+        try:
+            self.lsh = MinHashLSH(threshold=0.3, num_perm=128)
+            # Key by metadata index so LSH hits line up with vec_to_doc
+            # even when some text files are missing on disk
+            for meta_idx, doc in zip(self.corpus_meta_idx,
+                                     self._iter_corpus_texts()):
+                mh = self._minhash(doc)
+                self.doc_minhashes[meta_idx] = mh
+                self.lsh.insert(str(meta_idx), mh)
+        except Exception:
+            self.lsh = None
+
+    def _minhash(self, text: str) -> 'MinHash':
+        """Compute a MinHash over the text's 5-word shingles."""
+        mh = MinHash(num_perm=128)
+        for shingle in self.create_ngrams(text):
+            mh.update(shingle.encode('utf-8'))
+        return mh
+
+    def _fit_tfidf(self):
+        """Fit the TF-IDF vectorizer on the corpus once at startup.
+
+        Re-fitting on every detect() re-tokenizes the whole corpus per
+        query; fitting here leaves only a transform of the input text
+        and one sparse matmul on the hot path.
+        """
+        if not self.corpus_files:
+            return
+        try:
+            self.tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+            self.corpus_tfidf = self.tfidf_vectorizer.fit_transform(self._iter_corpus_texts())
+        except Exception:
+            self.tfidf_vectorizer = None
+            self.corpus_tfidf = None
+
     def preprocess_text(self, text: str) -> str:
-        """Preprocess text: lowercase, remove punctuation, remove stopwords."""
-        # Lowercase
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'http\S+|www\S+', '', text)
-        # Remove special characters but keep sentence structure
-        text = re.sub(r'[^a-z0-9\s\.\,\!\?]', '', text)
-        return text
+        """Preprocess text: lowercase, remove URLs and special characters."""
+        return _URL_RE.sub('', text.lower()).translate(_STRIP_TABLE)
     
     def create_ngrams(self, text: str, n: int = 5) -> List[str]:
         """Create n-word shingles for fingerprinting."""
@@ -96,51 +214,73 @@ class PlagiarismDetector:
             ngrams.append(' '.join(words[i:i+n]))
         return ngrams
     
-    def compute_tfidf_similarity(self, input_text: str, corpus_texts: List[str]) -> np.ndarray:
-        """Compute TF-IDF based cosine similarity."""
-        if not corpus_texts:
-            return np.array([])
-        
-        all_texts = [input_text] + corpus_texts
-        vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-        
+    def compute_tfidf_similarity(self, input_text: str) -> np.ndarray:
+        """Compute TF-IDF based cosine similarity against the fitted corpus."""
+        if self.tfidf_vectorizer is None:
+            return np.zeros(len(self.corpus_files))
+
         try:
-            tfidf_matrix = vectorizer.fit_transform(all_texts)
-            input_vector = tfidf_matrix[0:1]
-            corpus_vectors = tfidf_matrix[1:]
-            similarities = cosine_similarity(input_vector, corpus_vectors)[0]
-            return similarities
+            input_vector = self.tfidf_vectorizer.transform([input_text])
+            return cosine_similarity(input_vector, self.corpus_tfidf)[0]
         except Exception:
-            return np.zeros(len(corpus_texts))
+            return np.zeros(len(self.corpus_files))
     
-    def compute_embedding_similarity(self, input_sentences: List[str]) -> List[Dict]:
-        """Compute sentence embedding similarity using FAISS."""
+    def get_candidate_docs(self, text: str) -> Optional[set]:
+        """Query the LSH prefilter for plausible source documents.
+
+        Returns a set of document indices, or None when the prefilter is
+        unavailable (meaning: search everything).
+        """
+        if self.lsh is None:
+            return None
+        try:
+            return {int(key) for key in self.lsh.query(self._minhash(text))}
+        except Exception:
+            return None
+
+    def compute_embedding_similarity(self, input_sentences: List[str],
+                                     candidate_docs: Optional[set] = None
+                                     ) -> Tuple[List[Dict], np.ndarray]:
+        """Compute sentence embedding similarity using FAISS.
+
+        Returns the match dicts together with their similarity scores as
+        an ndarray, so callers can reduce over scores without rebuilding
+        a Python list.
+        """
         if not input_sentences or self.index.ntotal == 0:
-            return []
+            return [], np.empty(0, dtype=np.float32)
         
-        # Encode input sentences
+        # Encode input sentences and normalize for cosine search
         embeddings = self.embedding_model.encode(input_sentences)
-        
+        embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+        faiss.normalize_L2(embeddings)
+
         # Search FAISS index
         k = min(3, self.index.ntotal)  # Top-3 matches per sentence
-        distances, indices = self.index.search(embeddings.astype('float32'), k)
-        
+        similarities, indices = self.index.search(embeddings, k)
+
+        # Threshold and validity checks over the whole (B, k) result in
+        # one vectorized pass; Python only loops over the survivors
+        valid = (similarities > 0.7) & (indices != -1) & (indices < len(self.vec_to_doc))
+        rows, cols = np.nonzero(valid)
+        hit_sims = similarities[rows, cols]
+        doc_idxs = self.vec_to_doc[indices[rows, cols]]
+
         matches = []
-        for i, sentence in enumerate(input_sentences):
-            for j in range(k):
-                if indices[i][j] != -1:
-                    similarity = 1.0 / (1.0 + distances[i][j])  # Convert distance to similarity
-                    if similarity > 0.7:  # Threshold
-                        doc_idx = indices[i][j] // 10  # Approximate doc index
-                        if doc_idx < len(self.metadata):
-                            matches.append({
-                                'input_sentence': sentence,
-                                'matched_source': self.metadata[doc_idx].get('title', 'Unknown'),
-                                'similarity': float(similarity),
-                                'source_url': self.metadata[doc_idx].get('url', '')
-                            })
-        
-        return matches
+        match_sims = []
+        for row, sim, doc_idx in zip(rows, hit_sims, doc_idxs):
+            doc_idx = int(doc_idx)
+            if candidate_docs is not None and doc_idx not in candidate_docs:
+                continue
+            match_sims.append(sim)
+            matches.append({
+                'input_sentence': input_sentences[row],
+                'matched_source': self.metadata[doc_idx].get('title', 'Unknown'),
+                'similarity': float(sim),
+                'source_url': self.metadata[doc_idx].get('url', '')
+            })
+
+        return matches, np.asarray(match_sims, dtype=np.float32)
     
     def detect(self, text: str) -> Dict:
         """
@@ -152,10 +292,16 @@ class PlagiarismDetector:
                 'plagiarism_score': 0.0,
                 'plagiarism_level': 'None',
                 'matched_sentences': [],
-                'corpus_size': len(self.corpus_docs),
+                'corpus_size': len(self.corpus_files),
                 'method': 'hybrid'
             }
         
+        cache_key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return cached
+
         # Preprocess
         processed_text = self.preprocess_text(text)
         
@@ -163,15 +309,22 @@ class PlagiarismDetector:
         sentences = sent_tokenize(text)
         
         # TF-IDF similarity (document-level)
-        tfidf_scores = self.compute_tfidf_similarity(processed_text, self.corpus_docs)
+        tfidf_scores = self.compute_tfidf_similarity(processed_text)
         avg_tfidf_similarity = float(np.mean(tfidf_scores)) if len(tfidf_scores) > 0 else 0.0
         
-        # Sentence-level embedding similarity
-        matched_sentences = self.compute_embedding_similarity(sentences)
-        
+        # Sentence-level embedding similarity, prefiltered by MinHash-LSH:
+        # an empty candidate set means no corpus document shares shingles
+        # with the input, so the embedding search can be skipped outright
+        candidate_docs = self.get_candidate_docs(text)
+        if candidate_docs is not None and not candidate_docs:
+            matched_sentences = []
+            match_sims = np.empty(0, dtype=np.float32)
+        else:
+            matched_sentences, match_sims = self.compute_embedding_similarity(sentences, candidate_docs)
+
         # Calculate overall score
-        if len(matched_sentences) > 0:
-            avg_embedding_similarity = np.mean([m['similarity'] for m in matched_sentences])
+        if match_sims.size > 0:
+            avg_embedding_similarity = float(match_sims.mean())
             # Weighted average: 40% TF-IDF, 60% Embeddings
             plagiarism_score = (0.4 * avg_tfidf_similarity + 0.6 * avg_embedding_similarity) * 100
         else:
@@ -185,11 +338,17 @@ class PlagiarismDetector:
         else:
             level = 'High'
         
-        return {
+        result = {
             'plagiarism_score': round(plagiarism_score, 2),
             'plagiarism_level': level,
             'matched_sentences': matched_sentences[:10],  # Top 10 matches
-            'corpus_size': len(self.corpus_docs),
+            'corpus_size': len(self.corpus_files),
             'method': 'hybrid (TF-IDF + Embeddings + FAISS)',
-            'note': 'Results based on indexed corpus. Expand corpus for better accuracy.' if len(self.corpus_docs) < 100 else None
+            'note': 'Results based on indexed corpus. Expand corpus for better accuracy.' if len(self.corpus_files) < 100 else None
         }
+
+        self._result_cache[cache_key] = result
+        if len(self._result_cache) > self._cache_size:
+            self._result_cache.popitem(last=False)
+
+        return result
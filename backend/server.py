@@ -5,22 +5,35 @@ Production-grade REST API for text processing.
 
 import os
 import sys
+import time
 import logging
 import asyncio
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, UploadFile, File, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+# orjson serializes 3-5x faster than the stdlib encoder and handles
+# NumPy scalars from the detectors natively; fall back to the default
+# JSONResponse when it is unavailable
+try:
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    DefaultResponse = JSONResponse
+
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from models import (
     TextRequest, SummarizeRequest, ParaphraseRequest,
     TextResponse, ParaphraseResponse, GrammarResponse,
-    AIDetectResponse, PlagiarismResponse, UploadResponse,
+    AIDetectResponse, AIAnalysis, PlagiarismResponse, UploadResponse,
     HealthResponse, ErrorResponse,
 )
+import processor as processor_module
 from processor import TextProcessor
 from detection.plagiarism_engine import PlagiarismDetector
 from detection.ai_detector import AIContentDetector
@@ -31,7 +44,7 @@ from detection.models import (
 from detection.corpus_manager import CorpusManager
 import PyPDF2
 import docx
-from io import BytesIO
+import tempfile
 
 # ── Logging ───────────────────────────────────────────────────────
 LOG_DIR = os.path.join(os.path.expanduser("~"), ".jasper", "logs")
@@ -51,22 +64,48 @@ logger = logging.getLogger("jasper")
 processor: TextProcessor | None = None
 plagiarism_detector: PlagiarismDetector | None = None
 ai_detector: AIContentDetector | None = None
+corpus_manager: CorpusManager | None = None
+
+# Bounded executor for blocking inference: caps concurrent model calls
+# at the CPU count instead of the default executor's much larger pool,
+# preventing memory thrash under load.
+executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Process pool for the GIL-bound pure-Python processor methods (regex
+# scans, frequency statistics): threads cannot parallelize these, but
+# model-free worker processes can. Torch-backed detectors stay on the
+# thread pool — their kernels release the GIL and forking them would
+# duplicate gigabytes of weights per worker.
+try:
+    cpu_executor = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=processor_module.init_worker,
+    )
+except Exception:
+    cpu_executor = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global processor, plagiarism_detector, ai_detector
-    logger.info("Initializing Jasper TextProcessor …")
-    loop = asyncio.get_event_loop()
-    processor = await loop.run_in_executor(None, TextProcessor)
-    logger.info("TextProcessor ready.")
-    
-    logger.info("Initializing Detection Engines …")
-    plagiarism_detector = await loop.run_in_executor(None, PlagiarismDetector)
-    ai_detector = await loop.run_in_executor(None, AIContentDetector)
-    logger.info("Detection engines ready.")
-    
+    global processor, plagiarism_detector, ai_detector, corpus_manager
+    logger.info("Initializing engines …")
+    loop = asyncio.get_running_loop()
+    # The engines load independent models, so overlap their
+    # construction: cold start takes max(load times) instead of the sum.
+    # (The processor's BART summarizer itself loads lazily on first use.)
+    processor, plagiarism_detector, ai_detector, corpus_manager = \
+        await asyncio.gather(
+            loop.run_in_executor(executor, TextProcessor),
+            loop.run_in_executor(executor, PlagiarismDetector),
+            loop.run_in_executor(executor, AIContentDetector),
+            loop.run_in_executor(executor, CorpusManager),
+        )
+    logger.info("TextProcessor and detection engines ready.")
+
     yield
+    executor.shutdown(wait=False)
+    if cpu_executor is not None:
+        cpu_executor.shutdown(wait=False)
     logger.info("Shutting down Jasper backend.")
 
 
@@ -74,12 +113,26 @@ app = FastAPI(
     title="Jasper API",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 # ── CORS ──────────────────────────────────────────────────────────
+# Explicit origin list (comma-separated env override) instead of a
+# wildcard: lets Starlette take its precomputed fast path and skip
+# per-request origin matching. The default covers both renderer
+# origins — the Vite dev server, and the literal "null" that Chromium
+# sends for file:// pages in the packaged app.
+ALLOWED_ORIGINS = [
+    o.strip() for o in os.environ.get(
+        "JASPER_ALLOWED_ORIGINS",
+        "http://localhost:5173,http://127.0.0.1:5173,null",
+    ).split(",") if o.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=ALLOWED_ORIGINS,
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -89,7 +142,7 @@ app.add_middleware(
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     logger.exception("Unhandled exception")
-    return JSONResponse(
+    return DefaultResponse(
         status_code=500,
         content={"error": str(exc), "detail": type(exc).__name__},
     )
@@ -97,8 +150,97 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 # ── Helper to run blocking code ──────────────────────────────────
 async def run_blocking(func, *args):
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, func, *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+# ── Detection result cache ───────────────────────────────────────
+# The same document is often sent to several detection endpoints (or
+# retried) within seconds; a content-hash LRU returns repeat results
+# without touching the executors. Per-key locks stop a stampede of
+# identical concurrent requests from running inference N times.
+_detect_cache: OrderedDict = OrderedDict()
+_DETECT_CACHE_SIZE = 1024
+_detect_locks: dict = {}
+
+
+async def cached_detect(name, make_coro, text):
+    key = (name, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+    cached = _detect_cache.get(key)
+    if cached is not None:
+        _detect_cache.move_to_end(key)
+        return cached
+    lock = _detect_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        cached = _detect_cache.get(key)
+        if cached is None:
+            cached = await make_coro()
+            _detect_cache[key] = cached
+            if len(_detect_cache) > _DETECT_CACHE_SIZE:
+                _detect_cache.popitem(last=False)
+    _detect_locks.pop(key, None)
+    return cached
+
+
+async def run_cpu(method_name, *args):
+    """Run a pure-Python TextProcessor method on the process pool.
+
+    Falls back to the shared thread pool (via the in-process processor)
+    if the process pool could not be created.
+    """
+    if cpu_executor is None:
+        return await run_blocking(getattr(processor, method_name), *args)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        cpu_executor, processor_module.worker_call, method_name, *args)
+
+
+# ── Upload streaming ─────────────────────────────────────────────
+# Uploads are consumed in bounded chunks instead of one whole-file
+# read(): peak memory stays at the chunk size (plus the spool file on
+# disk for binary formats) and oversized bodies are rejected early.
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1 << 20
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    """Read an upload chunk-wise with a size cap."""
+    buf = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        buf += chunk
+        if len(buf) > MAX_UPLOAD_BYTES:
+            raise HTTPException(status_code=413, detail="File too large")
+    return bytes(buf)
+
+
+async def _spool_upload(file: UploadFile) -> str:
+    """Stream an upload to a temp file; returns its path."""
+    written = 0
+    with tempfile.NamedTemporaryFile(delete=False) as tmp:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+                written += len(chunk)
+                if written > MAX_UPLOAD_BYTES:
+                    raise HTTPException(status_code=413, detail="File too large")
+                tmp.write(chunk)
+        except Exception:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    return tmp.name
+
+
+# ── Blocking extraction helpers (run on the executor) ────────────
+def _extract_pdf(path: str) -> str:
+    pdf = PyPDF2.PdfReader(path)
+    # Generator feed: join consumes pages as they are extracted
+    # instead of materializing a second full-text list
+    return "\n".join(page.extract_text() for page in pdf.pages)
+
+
+def _extract_docx(path: str) -> str:
+    doc = docx.Document(path)
+    return "\n".join(p.text for p in doc.paragraphs)
 
 
 # ── Health ────────────────────────────────────────────────────────
@@ -110,13 +252,19 @@ async def health():
 # ── Humanize ──────────────────────────────────────────────────────
 @app.post("/api/humanize", response_model=TextResponse, responses={400: {"model": ErrorResponse}})
 async def humanize(req: TextRequest):
-    result = await run_blocking(processor.ai_to_human_converter, req.text)
+    # Trivial-input guard: answering here skips the executor hop the
+    # processor's own early return would otherwise still pay for
+    if not req.text.strip():
+        return TextResponse(result=req.text)
+    result = await run_cpu('ai_to_human_converter', req.text)
     return TextResponse(result=result)
 
 
 # ── Summarize ─────────────────────────────────────────────────────
 @app.post("/api/summarize", response_model=TextResponse, responses={400: {"model": ErrorResponse}})
 async def summarize(req: SummarizeRequest):
+    if not req.text.strip():
+        return TextResponse(result="No text to summarize")
     result = await run_blocking(processor.summarize_text, req.text, req.max_length, req.min_length)
     return TextResponse(result=result)
 
@@ -124,28 +272,43 @@ async def summarize(req: SummarizeRequest):
 # ── Paraphrase ────────────────────────────────────────────────────
 @app.post("/api/paraphrase", response_model=ParaphraseResponse, responses={400: {"model": ErrorResponse}})
 async def paraphrase(req: ParaphraseRequest):
-    result = await run_blocking(processor.paraphrase_text, req.text, req.variations)
+    if not req.text.strip():
+        return ParaphraseResponse(result=["No text to paraphrase"])
+    result = await run_cpu('paraphrase_text', req.text, req.variations)
     return ParaphraseResponse(result=result)
 
 
 # ── Grammar ───────────────────────────────────────────────────────
 @app.post("/api/grammar", response_model=GrammarResponse, responses={400: {"model": ErrorResponse}})
 async def grammar(req: TextRequest):
-    result = await run_blocking(processor.check_grammar, req.text)
+    if not req.text.strip():
+        return GrammarResponse(original=req.text, corrected=req.text, changes=[])
+    result = await run_cpu('check_grammar', req.text)
     return GrammarResponse(**result)
 
 
 # ── AI Detect ─────────────────────────────────────────────────────
 @app.post("/api/ai-detect", response_model=AIDetectResponse, responses={400: {"model": ErrorResponse}})
 async def ai_detect(req: TextRequest):
-    result = await run_blocking(processor.detect_ai_content, req.text)
+    if not req.text.strip():
+        return AIDetectResponse(
+            ai_score=0.0, is_ai_generated=False,
+            analysis=AIAnalysis(
+                lexical_diversity=0.0, sentence_length_variance=0.0,
+                avg_sentence_length=0.0, pattern_matches=0))
+    result = await cached_detect(
+        'processor_ai', lambda: run_cpu('detect_ai_content', req.text), req.text)
     return AIDetectResponse(**result)
 
 
 # ── Plagiarism ────────────────────────────────────────────────────
 @app.post("/api/plagiarism", response_model=PlagiarismResponse, responses={400: {"model": ErrorResponse}})
 async def plagiarism(req: TextRequest):
-    result = await run_blocking(processor.check_plagiarism, req.text)
+    if not req.text.strip():
+        return PlagiarismResponse(
+            plagiarism_score=0.0, originality_score=1.0, matches=[])
+    result = await cached_detect(
+        'processor_plag', lambda: run_cpu('check_plagiarism', req.text), req.text)
     return PlagiarismResponse(**result)
 
 
@@ -154,30 +317,62 @@ async def plagiarism(req: TextRequest):
 async def upload_file(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="Empty filename")
-    content = await file.read()
+    content = await _read_upload(file)
     text = content.decode("utf-8", errors="replace")
     return UploadResponse(text=text, filename=file.filename)
 
 
 # ── Detection: Plagiarism ─────────────────────────────────────────
+def _empty_plagiarism_result() -> PlagiarismResult:
+    return PlagiarismResult(
+        plagiarism_score=0.0, plagiarism_level='None', matched_sentences=[],
+        corpus_size=len(plagiarism_detector.corpus_files), method='hybrid')
+
+
+def _empty_ai_result() -> AIDetectionResult:
+    return AIDetectionResult(
+        ai_probability=0.0, ai_confidence='Low', method='ensemble')
+
+
 @app.post("/api/detect/plagiarism", response_model=PlagiarismResult)
 async def detect_plagiarism(req: DetectionRequest):
-    result = await run_blocking(plagiarism_detector.detect, req.text)
+    if not req.text.strip():
+        return _empty_plagiarism_result()
+    result = await cached_detect(
+        'plagiarism', lambda: run_blocking(plagiarism_detector.detect, req.text),
+        req.text)
     return PlagiarismResult(**result)
 
 
 # ── Detection: AI Content ─────────────────────────────────────────
 @app.post("/api/detect/ai", response_model=AIDetectionResult)
 async def detect_ai_content(req: DetectionRequest):
-    result = await run_blocking(ai_detector.detect, req.text)
+    if not req.text.strip():
+        return _empty_ai_result()
+    result = await cached_detect(
+        'ai', lambda: run_blocking(ai_detector.detect, req.text), req.text)
     return AIDetectionResult(**result)
 
 
 # ── Detection: Hybrid (Both) ──────────────────────────────────────
 @app.post("/api/detect/hybrid", response_model=HybridDetectionResult)
 async def detect_hybrid(req: DetectionRequest):
-    plag_result = await run_blocking(plagiarism_detector.detect, req.text)
-    ai_result = await run_blocking(ai_detector.detect, req.text)
+    if not req.text.strip():
+        return HybridDetectionResult(
+            plagiarism=_empty_plagiarism_result(),
+            ai_detection=_empty_ai_result())
+    # Same cache keys as the single-engine endpoints, so a hybrid call
+    # after either one reuses its result (and vice versa). The two
+    # engines are independent, so run them concurrently: wall time is
+    # max(t_plag, t_ai) instead of their sum.
+    plag_result, ai_result = await asyncio.gather(
+        cached_detect(
+            'plagiarism',
+            lambda: run_blocking(plagiarism_detector.detect, req.text),
+            req.text),
+        cached_detect(
+            'ai', lambda: run_blocking(ai_detector.detect, req.text), req.text),
+    )
     return HybridDetectionResult(
         plagiarism=PlagiarismResult(**plag_result),
         ai_detection=AIDetectionResult(**ai_result)
@@ -185,11 +380,21 @@ async def detect_hybrid(req: DetectionRequest):
 
 
 # ── Corpus Stats ──────────────────────────────────────────────────
+_stats_cache: tuple | None = None
+_STATS_TTL_SECONDS = 30.0
+
+
 @app.get("/api/corpus/stats", response_model=CorpusStats)
 async def get_corpus_stats():
-    corpus_mgr = CorpusManager()
-    stats = await run_blocking(corpus_mgr.get_stats)
-    return CorpusStats(**stats)
+    # Served from the lifespan singleton with a short TTL: the corpus
+    # only changes when documents are added, so re-walking it per poll
+    # is wasted I/O
+    global _stats_cache
+    now = time.monotonic()
+    if _stats_cache is None or now - _stats_cache[0] > _STATS_TTL_SECONDS:
+        stats = await run_blocking(corpus_manager.get_stats)
+        _stats_cache = (now, stats)
+    return CorpusStats(**_stats_cache[1])
 
 
 # ── File Upload with Extraction ───────────────────────────────────
@@ -198,25 +403,32 @@ async def upload_extract(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="Empty filename")
     
-    content = await file.read()
     text = ""
-    
-    # Extract based on file type
+
+    # Extract based on file type, off the event loop: parsing a
+    # multi-MB PDF inline would stall every other request. Binary
+    # formats are spooled to disk so the parser reads from a file
+    # instead of a second in-memory copy.
     if file.filename.endswith('.pdf'):
+        tmp_path = await _spool_upload(file)
         try:
-            pdf = PyPDF2.PdfReader(BytesIO(content))
-            text = "\n".join([page.extract_text() for page in pdf.pages])
+            text = await run_blocking(_extract_pdf, tmp_path)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"PDF extraction failed: {str(e)}")
-    
+        finally:
+            os.unlink(tmp_path)
+
     elif file.filename.endswith('.docx'):
+        tmp_path = await _spool_upload(file)
         try:
-            doc = docx.Document(BytesIO(content))
-            text = "\n".join([p.text for p in doc.paragraphs])
+            text = await run_blocking(_extract_docx, tmp_path)
         except Exception as e:
             raise HTTPException(status_code=400, detail=f"DOCX extraction failed: {str(e)}")
-    
+        finally:
+            os.unlink(tmp_path)
+
     else:  # TXT or other
+        content = await _read_upload(file)
         text = content.decode("utf-8", errors="replace")
     
     return {"text": text, "filename": file.filename, "length": len(text)}
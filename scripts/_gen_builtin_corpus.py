@@ -0,0 +1,137 @@
+"""
+Generate the precomputed built-in sample corpus.
+
+Writes backend/data/_builtin_corpus.py (a fully expanded BUILTIN_DOCS
+literal) and, when the embedding stack is installed, a companion
+backend/data/_builtin_embs.npz with pre-normalized sentence embeddings
+so first-run corpus builds skip the transformer entirely.
+
+Run this once after editing the templates below; the output is checked
+in so build_corpus.py never rebuilds the list at runtime.
+"""
+
+import os
+import pprint
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+OUT_DIR = Path(__file__).parent.parent / "backend" / "data"
+
+
+def build_sample_docs():
+    """Expand the hand-written docs plus topic templates into one list."""
+    sample_docs = [
+        {
+            "title": "Artificial Intelligence Overview",
+            "content": """Artificial intelligence (AI) is intelligence demonstrated by machines, as opposed to natural intelligence displayed by animals including humans. AI research has been defined as the field of study of intelligent agents, which refers to any system that perceives its environment and takes actions that maximize its chance of achieving its goals. The term artificial intelligence had previously been used to describe machines that mimic and display human cognitive skills that are associated with the human mind, such as learning and problem-solving. This definition has since been rejected by major AI researchers who now describe AI in terms of rationality and acting rationally, which does not limit how intelligence can be articulated.""",
+            "source": "Built-in Sample",
+            "url": ""
+        },
+        {
+            "title": "Machine Learning Fundamentals",
+            "content": """Machine learning is a method of data analysis that automates analytical model building. It is a branch of artificial intelligence based on the idea that systems can learn from data, identify patterns and make decisions with minimal human intervention. Machine learning algorithms are trained on data sets that contain many examples that include the desired inputs and outputs. The algorithm then tries to identify patterns in the data that map the inputs to the outputs.""",
+            "source": "Built-in Sample",
+            "url": ""
+        },
+        {
+            "title": "Data Science Introduction",
+            "content": """Data science is an interdisciplinary field that uses scientific methods, processes, algorithms and systems to extract knowledge and insights from structured and unstructured data. Data science is related to data mining, machine learning and big data. Data science is a concept to unify statistics, data analysis, informatics, and their related methods in order to understand and analyze actual phenomena with data.""",
+            "source": "Built-in Sample",
+            "url": ""
+        },
+        {
+            "title": "Natural Language Processing",
+            "content": """Natural language processing (NLP) is a subfield of linguistics, computer science, and artificial intelligence concerned with the interactions between computers and human language, in particular how to program computers to process and analyze large amounts of natural language data. The goal is a computer capable of understanding the contents of documents, including the contextual nuances of the language within them.""",
+            "source": "Built-in Sample",
+            "url": ""
+        },
+        {
+            "title": "Deep Learning Networks",
+            "content": """Deep learning is part of a broader family of machine learning methods based on artificial neural networks with representation learning. Learning can be supervised, semi-supervised or unsupervised. Deep-learning architectures such as deep neural networks, deep belief networks, deep reinforcement learning, recurrent neural networks and convolutional neural networks have been applied to fields including computer vision, speech recognition, natural language processing, machine translation, bioinformatics, drug design, medical image analysis, material inspection and board game programs.""",
+            "source": "Built-in Sample",
+            "url": ""
+        },
+    ]
+
+    additional_topics = [
+        "Computer Vision", "Reinforcement Learning", "Neural Architecture Search",
+        "Transfer Learning", "Generative Adversarial Networks", "Transformer Models",
+        "BERT and Language Models", "Computer Graphics", "Quantum Computing",
+        "Blockchain Technology", "Cloud Computing", "Edge Computing",
+        "Internet of Things", "Cybersecurity", "Software Engineering",
+        "Database Systems", "Distributed Systems", "Operating Systems",
+        "Computer Networks", "Web Development", "Mobile Development",
+        "DevOps Practices", "Agile Methodology", "Software Testing",
+        "Version Control Systems", "Continuous Integration"
+    ]
+
+    for topic in additional_topics:
+        sample_docs.append({
+            "title": topic,
+            "content": f"""{topic} is an important area of study in computer science and technology. It encompasses various methodologies, techniques, and best practices that are essential for modern software development and technological advancement. Understanding {topic} requires both theoretical knowledge and practical experience. Researchers and practitioners continue to develop new approaches and improvements in this field.""",
+            "source": "Built-in Sample",
+            "url": ""
+        })
+
+    return sample_docs
+
+
+def main():
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    docs = build_sample_docs()
+
+    module_path = OUT_DIR / "_builtin_corpus.py"
+    with open(module_path, 'w', encoding='utf-8') as f:
+        f.write('"""Precomputed built-in sample corpus.\n\n')
+        f.write('Generated by scripts/_gen_builtin_corpus.py — do not edit by hand.\n')
+        f.write('"""\n\n')
+        f.write('BUILTIN_DOCS = ')
+        f.write(pprint.pformat(docs, width=100, sort_dicts=False))
+        f.write('\n')
+    print(f"Wrote {module_path} ({len(docs)} documents)")
+
+    # Precompute normalized sentence embeddings so build_corpus.py can
+    # skip the transformer on the default first-run path. Optional: the
+    # literal above is still usable without them.
+    try:
+        import numpy as np
+        import faiss
+        from nltk.tokenize import sent_tokenize
+        from sentence_transformers import SentenceTransformer
+    except ImportError as e:
+        print(f"Skipping embedding precompute (missing dependency: {e})")
+        return
+
+    local_model = Path(__file__).parent.parent / "backend" / "models_local" / "sentence-transformers" / "all-MiniLM-L6-v2"
+    model = SentenceTransformer(str(local_model) if local_model.exists() else 'all-MiniLM-L6-v2')
+
+    all_sentences = []
+    sent_counts = []
+    for doc in docs:
+        sentences = sent_tokenize(doc['content'])
+        all_sentences.extend(sentences)
+        sent_counts.append(len(sentences))
+
+    embeddings = model.encode(
+        all_sentences,
+        batch_size=128,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    embeddings = np.ascontiguousarray(embeddings, dtype='float32')
+    faiss.normalize_L2(embeddings)
+
+    embs_path = OUT_DIR / "_builtin_embs.npz"
+    np.savez(
+        embs_path,
+        embs=embeddings,
+        sent_counts=np.asarray(sent_counts, dtype=np.int64),
+    )
+    print(f"Wrote {embs_path} ({embeddings.shape[0]} sentence vectors)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+Build the plagiarism corpus as N parallel FAISS shards.
+
+Each worker process encodes and indexes its slice of the documents
+independently, writing corpus/shard_{i}.faiss plus metadata — the
+aggregate is query-equivalent to one monolithic index (see
+CorpusManager.load_shards/search_shards) but builds ~N times faster on
+a multi-core box and caps per-process RAM at one shard.
+
+Use scripts/build_corpus.py for the single-index build.
+"""
+
+import sys
+import os
+import mmap
+from multiprocessing import Pool
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import faiss
+
+from backend.detection.corpus_manager import CorpusManager
+from backend.data._builtin_corpus import BUILTIN_DOCS
+
+
+def _read_txt(txt_file):
+    """Read one corpus source file into a document dict."""
+    txt_file = Path(txt_file)
+    with open(txt_file, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = mm.read().decode('utf-8')
+        except ValueError:
+            # Empty files cannot be mapped
+            content = f.read().decode('utf-8')
+    return {
+        "id": txt_file.stem,
+        "title": txt_file.stem.replace('_', ' ').title(),
+        "content": content,
+        "source": "Local File",
+        "url": "",
+    }
+
+
+def build_one_shard(shard_id, docs):
+    """Encode and index one shard's documents in this worker process."""
+    corpus_mgr = CorpusManager()
+
+    # Fresh per-shard index regardless of any monolithic index on disk
+    corpus_mgr.index = faiss.IndexHNSWFlat(384, 32, faiss.METRIC_INNER_PRODUCT)
+    corpus_mgr.index.hnsw.efConstruction = 200
+    corpus_mgr.metadata = []
+
+    corpus_mgr.add_documents_bulk(docs)
+    corpus_mgr.save_shard(shard_id)
+    return shard_id, len(docs)
+
+
+def collect_docs():
+    """Gather the same documents build_corpus.py would index."""
+    corpus_source_dir = Path(__file__).parent.parent / "data" / "corpus_source"
+    corpus_source_dir.mkdir(parents=True, exist_ok=True)
+    sample_files = list(corpus_source_dir.glob("*.txt"))
+
+    if sample_files:
+        print(f"Found {len(sample_files)} text files in corpus_source/")
+        return [_read_txt(txt_file) for txt_file in sample_files]
+
+    print("No sample documents found, using built-in texts")
+    return [
+        {
+            "id": f"sample_{i+1:03d}",
+            "title": doc['title'],
+            "content": doc['content'],
+            "source": doc['source'],
+            "url": doc['url'],
+        }
+        for i, doc in enumerate(BUILTIN_DOCS)
+    ]
+
+
+def main():
+    print("=" * 60)
+    print("Jasper — Sharded Corpus Builder")
+    print("Building FAISS shards in parallel")
+    print("=" * 60)
+
+    docs = collect_docs()
+    num_shards = min(os.cpu_count() or 1, len(docs))
+
+    # Round-robin split keeps shard sizes balanced
+    shards = [docs[i::num_shards] for i in range(num_shards)]
+
+    print(f"\nBuilding {num_shards} shards from {len(docs)} documents...")
+    with Pool(num_shards) as pool:
+        results = pool.starmap(build_one_shard, enumerate(shards))
+
+    print("\n" + "=" * 60)
+    print("Sharded corpus built successfully!")
+    for shard_id, count in sorted(results):
+        print(f"  shard_{shard_id}: {count} documents")
+    print("Load with CorpusManager.load_shards() and query via search_shards().")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()